@@ -1,12 +1,33 @@
 import sqlite3
+import hashlib
 import json
 import os
+import sys
+import tempfile
 
 # Configuration
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 DB_NAME = os.path.join(SCRIPT_DIR, "plants.db")
 KB_JSON = os.path.join(SCRIPT_DIR, "plants-kb.json")
 CATALOG_JSON = os.path.join(SCRIPT_DIR, "plants-catalog.json")
+SHARDS_DIR = os.path.join(SCRIPT_DIR, "shards")
+SHARD_SIZE = 25
+REBUILD_TIMEOUT = 60
+SHADOW_SUFFIX = "_rebuild"
+
+# Live tables, parents first
+TABLES = [
+    "plants",
+    "plant_requirements",
+    "plant_soil_types",
+    "plant_growth_stages",
+    "plant_interactions",
+    "plant_seasonality",
+    "plant_pests",
+    "plant_diseases",
+    "plant_nutrients",
+]
+
 
 # Mapping for month conversion to integers
 MONTHS = {
@@ -23,13 +44,19 @@ MONTHS = {
     "November": 11,
     "December": 12,
 }
+MONTH_NAMES = ["", *MONTHS]
+
 
+def setup_database(cursor, suffix=""):
+    """Initializes the comprehensive normalized schema.
 
-def setup_database(cursor):
-    """Initializes the comprehensive normalized schema."""
-    cursor.executescript("""
+    Tables are created as ``<name><suffix>`` so a rebuild can fill shadow
+    tables next to the live ones. Statements run one by one rather than via
+    executescript, which would commit the caller's open transaction.
+    """
+    schema = f"""
         -- Core plant information
-        CREATE TABLE IF NOT EXISTS plants (
+        CREATE TABLE IF NOT EXISTS plants{suffix} (
             plant_id TEXT PRIMARY KEY,
             common_name TEXT NOT NULL,
             scientific_name TEXT,
@@ -40,82 +67,91 @@ def setup_database(cursor):
         );
 
         -- Plant requirements
-        CREATE TABLE IF NOT EXISTS plant_requirements (
+        CREATE TABLE IF NOT EXISTS plant_requirements{suffix} (
             plant_id TEXT PRIMARY KEY,
             sunlight TEXT,
             water_requirements TEXT,
             soil_ph TEXT,
-            FOREIGN KEY (plant_id) REFERENCES plants(plant_id)
+            FOREIGN KEY (plant_id) REFERENCES plants{suffix}(plant_id)
         );
 
         -- Soil types (many-to-many)
-        CREATE TABLE IF NOT EXISTS plant_soil_types (
+        CREATE TABLE IF NOT EXISTS plant_soil_types{suffix} (
             plant_id TEXT,
             soil_type TEXT,
             PRIMARY KEY (plant_id, soil_type),
-            FOREIGN KEY (plant_id) REFERENCES plants(plant_id)
+            FOREIGN KEY (plant_id) REFERENCES plants{suffix}(plant_id)
         );
 
         -- Growth stages (ordered list with metadata)
-        CREATE TABLE IF NOT EXISTS plant_growth_stages (
+        CREATE TABLE IF NOT EXISTS plant_growth_stages{suffix} (
             plant_id TEXT,
             stage_order INTEGER,
             stage_name TEXT,
             duration_days INTEGER,
             water_interval_days INTEGER,
             PRIMARY KEY (plant_id, stage_order),
-            FOREIGN KEY (plant_id) REFERENCES plants(plant_id)
+            FOREIGN KEY (plant_id) REFERENCES plants{suffix}(plant_id)
         );
 
         -- Plant interactions (companions and incompatibles)
-        CREATE TABLE IF NOT EXISTS plant_interactions (
+        CREATE TABLE IF NOT EXISTS plant_interactions{suffix} (
             plant_a TEXT,
             plant_b TEXT,
             type TEXT CHECK(type IN ('companion', 'incompatible')),
             PRIMARY KEY (plant_a, plant_b, type),
-            FOREIGN KEY (plant_a) REFERENCES plants(plant_id),
-            FOREIGN KEY (plant_b) REFERENCES plants(plant_id)
+            FOREIGN KEY (plant_a) REFERENCES plants{suffix}(plant_id),
+            FOREIGN KEY (plant_b) REFERENCES plants{suffix}(plant_id)
         );
 
         -- Seasonality windows
-        CREATE TABLE IF NOT EXISTS plant_seasonality (
+        CREATE TABLE IF NOT EXISTS plant_seasonality{suffix} (
             plant_id TEXT,
             activity TEXT CHECK(activity IN ('sowing', 'harvest')),
             start_month INTEGER,
             end_month INTEGER,
-            FOREIGN KEY (plant_id) REFERENCES plants(plant_id)
+            FOREIGN KEY (plant_id) REFERENCES plants{suffix}(plant_id)
         );
 
         -- Common pests
-        CREATE TABLE IF NOT EXISTS plant_pests (
+        CREATE TABLE IF NOT EXISTS plant_pests{suffix} (
             plant_id TEXT,
             pest_id TEXT,
             PRIMARY KEY (plant_id, pest_id),
-            FOREIGN KEY (plant_id) REFERENCES plants(plant_id)
+            FOREIGN KEY (plant_id) REFERENCES plants{suffix}(plant_id)
         );
 
         -- Common diseases
-        CREATE TABLE IF NOT EXISTS plant_diseases (
+        CREATE TABLE IF NOT EXISTS plant_diseases{suffix} (
             plant_id TEXT,
             disease_id TEXT,
             PRIMARY KEY (plant_id, disease_id),
-            FOREIGN KEY (plant_id) REFERENCES plants(plant_id)
+            FOREIGN KEY (plant_id) REFERENCES plants{suffix}(plant_id)
         );
 
         -- Nutrient preferences
-        CREATE TABLE IF NOT EXISTS plant_nutrients (
+        CREATE TABLE IF NOT EXISTS plant_nutrients{suffix} (
             plant_id TEXT,
             nutrient_preference TEXT,
             PRIMARY KEY (plant_id, nutrient_preference),
-            FOREIGN KEY (plant_id) REFERENCES plants(plant_id)
+            FOREIGN KEY (plant_id) REFERENCES plants{suffix}(plant_id)
         );
+    """
+    for statement in schema.split(";"):
+        if statement.strip():
+            cursor.execute(statement)
+
 
-        -- Create indexes
-        CREATE INDEX IF NOT EXISTS idx_plant_type ON plants(plant_type);
-        CREATE INDEX IF NOT EXISTS idx_plant_family ON plants(family);
-        CREATE INDEX IF NOT EXISTS idx_seasonality_activity ON plant_seasonality(activity);
-        CREATE INDEX IF NOT EXISTS idx_interactions_type ON plant_interactions(type);
-    """)
+def create_indexes(cursor):
+    """Creates the lookup indexes on the live tables."""
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_plant_type ON plants(plant_type)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_plant_family ON plants(family)")
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_seasonality_activity ON plant_seasonality(activity)"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_interactions_type ON plant_interactions(type)"
+    )
 
 
 def parse_month(m):
@@ -250,34 +286,16 @@ def merge_data(catalog_data, kb_data):
     return plants_dict
 
 
-def ingest_data(db_path, plants):
-    """Ingests merged plant data into SQLite database."""
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-
-    # Drop existing tables to ensure schema updates are applied
-    tables = [
-        "plant_nutrients",
-        "plant_diseases",
-        "plant_pests",
-        "plant_seasonality",
-        "plant_interactions",
-        "plant_growth_stages",
-        "plant_soil_types",
-        "plant_requirements",
-        "plants",
-    ]
-    for table in tables:
-        cursor.execute(f"DROP TABLE IF EXISTS {table}")
-
-    setup_database(cursor)
+def populate_database(cursor, plants, suffix=""):
+    """Creates the schema and inserts merged plant entries into it."""
+    setup_database(cursor, suffix)
 
     print(f"Ingesting {len(plants)} merged plant entries...")
 
     for p_id, entry in plants.items():
         # 1. Plants
         cursor.execute(
-            "INSERT INTO plants (plant_id, common_name, scientific_name, family, plant_type, life_cycle, notes) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            f"INSERT INTO plants{suffix} (plant_id, common_name, scientific_name, family, plant_type, life_cycle, notes) VALUES (?, ?, ?, ?, ?, ?, ?)",
             (
                 p_id,
                 entry["common_name"],
@@ -291,21 +309,21 @@ def ingest_data(db_path, plants):
 
         # 2. Requirements
         cursor.execute(
-            "INSERT INTO plant_requirements (plant_id, sunlight, water_requirements, soil_ph) VALUES (?, ?, ?, ?)",
+            f"INSERT INTO plant_requirements{suffix} (plant_id, sunlight, water_requirements, soil_ph) VALUES (?, ?, ?, ?)",
             (p_id, entry["sunlight"], entry["water_requirements"], entry["soil_ph"]),
         )
 
         # 3. Soil Types
         for st in set(entry["soil_types"]):
             cursor.execute(
-                "INSERT OR IGNORE INTO plant_soil_types (plant_id, soil_type) VALUES (?, ?)",
+                f"INSERT OR IGNORE INTO plant_soil_types{suffix} (plant_id, soil_type) VALUES (?, ?)",
                 (p_id, st),
             )
 
         # 4. Growth Stages
         for idx, stage in enumerate(entry["growth_stages"]):
             cursor.execute(
-                "INSERT INTO plant_growth_stages (plant_id, stage_order, stage_name, duration_days, water_interval_days) VALUES (?, ?, ?, ?, ?)",
+                f"INSERT INTO plant_growth_stages{suffix} (plant_id, stage_order, stage_name, duration_days, water_interval_days) VALUES (?, ?, ?, ?, ?)",
                 (p_id, idx, stage["name"], stage["duration"], stage["water_interval"]),
             )
 
@@ -321,7 +339,7 @@ def ingest_data(db_path, plants):
                     end = parse_month(window.get("end_month"))
                     if start and end:
                         cursor.execute(
-                            "INSERT INTO plant_seasonality (plant_id, activity, start_month, end_month) VALUES (?, ?, ?, ?)",
+                            f"INSERT INTO plant_seasonality{suffix} (plant_id, activity, start_month, end_month) VALUES (?, ?, ?, ?)",
                             (p_id, activity, start, end),
                         )
 
@@ -329,40 +347,72 @@ def ingest_data(db_path, plants):
         for companion in entry["companion_plants"]:
             pair = sorted([p_id, companion])
             cursor.execute(
-                "INSERT OR IGNORE INTO plant_interactions (plant_a, plant_b, type) VALUES (?, ?, ?)",
+                f"INSERT OR IGNORE INTO plant_interactions{suffix} (plant_a, plant_b, type) VALUES (?, ?, ?)",
                 (pair[0], pair[1], "companion"),
             )
         for antagonist in entry["incompatible_plants"]:
             pair = sorted([p_id, antagonist])
             cursor.execute(
-                "INSERT OR IGNORE INTO plant_interactions (plant_a, plant_b, type) VALUES (?, ?, ?)",
+                f"INSERT OR IGNORE INTO plant_interactions{suffix} (plant_a, plant_b, type) VALUES (?, ?, ?)",
                 (pair[0], pair[1], "incompatible"),
             )
 
         # 7. Pests, Diseases, Nutrients
         for pest in entry["common_pests"]:
             cursor.execute(
-                "INSERT OR IGNORE INTO plant_pests (plant_id, pest_id) VALUES (?, ?)",
+                f"INSERT OR IGNORE INTO plant_pests{suffix} (plant_id, pest_id) VALUES (?, ?)",
                 (p_id, pest),
             )
         for disease in entry["common_diseases"]:
             cursor.execute(
-                "INSERT OR IGNORE INTO plant_diseases (plant_id, disease_id) VALUES (?, ?)",
+                f"INSERT OR IGNORE INTO plant_diseases{suffix} (plant_id, disease_id) VALUES (?, ?)",
                 (p_id, disease),
             )
         for nutrient in entry["nutrient_preferences"]:
             cursor.execute(
-                "INSERT OR IGNORE INTO plant_nutrients (plant_id, nutrient_preference) VALUES (?, ?)",
+                f"INSERT OR IGNORE INTO plant_nutrients{suffix} (plant_id, nutrient_preference) VALUES (?, ?)",
                 (p_id, nutrient),
             )
 
-    conn.commit()
-    conn.close()
+
+def ingest_data(db_path, plants):
+    """Ingests merged plant data into SQLite database.
+
+    The DB is kept in WAL mode. A rebuild fills shadow tables next to the live
+    ones and then drops and renames them, all in one write transaction, so
+    readers keep their current snapshot until the swap commits and never see
+    missing tables or a half-populated catalog. Overlapping rebuilds queue on
+    the write lock instead of interleaving.
+    """
+    conn = sqlite3.connect(db_path, timeout=REBUILD_TIMEOUT, isolation_level=None)
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        cursor = conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            for table in TABLES:
+                cursor.execute(f"DROP TABLE IF EXISTS {table}{SHADOW_SUFFIX}")
+            populate_database(cursor, plants, SHADOW_SUFFIX)
+
+            # Swap the shadow tables in; renaming plants<suffix> also rewrites
+            # the foreign keys that point at it.
+            for table in reversed(TABLES):
+                cursor.execute(f"DROP TABLE IF EXISTS {table}")
+            for table in TABLES:
+                cursor.execute(f"ALTER TABLE {table}{SHADOW_SUFFIX} RENAME TO {table}")
+            create_indexes(cursor)
+            cursor.execute("COMMIT")
+        except BaseException:
+            cursor.execute("ROLLBACK")
+            raise
+    finally:
+        conn.close()
+
     print(f"Successfully migrated data to {db_path}")
 
 
-def export_data(db_path):
-    """Exports data from SQLite back to JSON files."""
+def build_export(db_path):
+    """Reads the SQLite DB into catalog and KB entry lists, in plant order."""
     conn = sqlite3.connect(db_path)
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
@@ -478,16 +528,8 @@ def export_data(db_path):
                 "growth_stage": [s["stage_name"] for s in stages],
                 "seasonality": {
                     act: {
-                        "start_month": list(MONTHS.keys())[
-                            list(MONTHS.values()).index(win[0]["start_month"])
-                        ]
-                        if win
-                        else "",
-                        "end_month": list(MONTHS.keys())[
-                            list(MONTHS.values()).index(win[0]["end_month"])
-                        ]
-                        if win
-                        else "",
+                        "start_month": MONTH_NAMES[win[0]["start_month"]] if win else "",
+                        "end_month": MONTH_NAMES[win[0]["end_month"]] if win else "",
                     }
                     for act, win in seasonality.items()
                     if win
@@ -500,24 +542,162 @@ def export_data(db_path):
             }
         )
 
+    conn.close()
+    return catalog_output, kb_output
+
+
+def export_data(db_path):
+    """Exports data from SQLite back to JSON files."""
+    catalog_output, kb_output = build_export(db_path)
+
     with open(CATALOG_JSON, "w", encoding="utf-8") as f:
         json.dump(catalog_output, f, indent=2)
     with open(KB_JSON, "w", encoding="utf-8") as f:
         json.dump(kb_output, f, indent=2)
 
-    conn.close()
     print(f"Successfully exported data to JSON files from {db_path}")
 
 
-if __name__ == "__main__":
-    import sys
+def season_months(windows):
+    """Expands seasonality windows into the sorted months they cover."""
+    months = set()
+    for window in windows:
+        start, end = window["start_month"], window["end_month"]
+        month = start
+        while True:
+            months.add(month)
+            if month == end:
+                break
+            month = month % 12 + 1
+    return sorted(months)
+
+
+def write_json_atomic(path, data):
+    """Writes ``data`` as JSON to a temp file beside ``path``, then renames it in."""
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(path), prefix=f"{os.path.basename(path)}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def export_shards(db_path, shards_dir=SHARDS_DIR, shard_size=SHARD_SIZE):
+    """Exports the catalog and KB as shards grouped by plant type, plus an index.
+
+    Plants are grouped by ``plant_type`` and sorted by id within each group;
+    each group is cut into shards of up to ``shard_size`` plants, so a shard
+    covers a real id range of a single type. Every plant appears in exactly
+    one shard with the same catalog and KB entries ``export_data`` writes.
+    ``index.json`` maps plant ids, names, types and months to shards so the
+    app can fetch only what it needs.
+
+    Shard file names carry a hash of the export, so a new export never
+    overwrites files the current index points at. ``index.json`` is replaced
+    last, and only then are shards from earlier exports removed.
+    """
+    if shard_size < 1:
+        raise ValueError(f"shard_size must be at least 1, got {shard_size}")
+
+    catalog_output, kb_output = build_export(db_path)
+    entries = sorted(
+        zip(catalog_output, kb_output),
+        key=lambda pair: (pair[0]["plant_type"] or "", pair[0]["id"]),
+    )
+    generation = hashlib.sha1(
+        json.dumps(entries, sort_keys=True).encode("utf-8")
+    ).hexdigest()[:10]
+
+    groups = {}
+    for catalog_entry, kb_entry in entries:
+        groups.setdefault(catalog_entry["plant_type"], []).append(
+            (catalog_entry, kb_entry)
+        )
+
+    index = {
+        "generation": generation,
+        "shard_size": shard_size,
+        "total": len(entries),
+        "shards": [],
+        "plants": {},
+        "types": {},
+        "months": {str(m): [] for m in MONTHS.values()},
+    }
+
+    os.makedirs(shards_dir, exist_ok=True)
+    for plant_type, group in groups.items():
+        for offset in range(0, len(group), shard_size):
+            chunk = group[offset : offset + shard_size]
+            shard_no = len(index["shards"])
+            file_name = f"plants-{generation}-{shard_no:03d}.json"
+            shard_path = os.path.join(shards_dir, file_name)
+
+            # Same name means same export, so an existing file is already current
+            if not os.path.exists(shard_path):
+                write_json_atomic(
+                    shard_path,
+                    {
+                        "catalog": [catalog_entry for catalog_entry, _ in chunk],
+                        "kb": [kb_entry for _, kb_entry in chunk],
+                    },
+                )
+
+            shard_months = set()
+            for catalog_entry, _ in chunk:
+                sowing = season_months(catalog_entry["seasonality"]["sowing"])
+                harvest = season_months(catalog_entry["seasonality"]["harvest"])
+                shard_months.update(sowing, harvest)
+                index["plants"][catalog_entry["id"]] = {
+                    "name": catalog_entry["name"],
+                    "plant_type": plant_type,
+                    "shard": shard_no,
+                    "sowing_months": sowing,
+                    "harvest_months": harvest,
+                }
+            for month in sorted(shard_months):
+                index["months"][str(month)].append(shard_no)
+            index["types"].setdefault(plant_type or "", []).append(shard_no)
+
+            index["shards"].append(
+                {
+                    "file": file_name,
+                    "plant_type": plant_type,
+                    "count": len(chunk),
+                    "first_id": chunk[0][0]["id"],
+                    "last_id": chunk[-1][0]["id"],
+                }
+            )
+
+    write_json_atomic(os.path.join(shards_dir, "index.json"), index)
+
+    current = {shard["file"] for shard in index["shards"]}
+    for name in os.listdir(shards_dir):
+        if name.startswith("plants-") and name.endswith(".json"):
+            if name not in current:
+                os.remove(os.path.join(shards_dir, name))
+
+    print(f"Successfully exported {len(index['shards'])} shards to {shards_dir}")
 
+
+if __name__ == "__main__":
     try:
         if len(sys.argv) > 1 and sys.argv[1] == "export":
             if os.path.exists(DB_NAME):
                 export_data(DB_NAME)
             else:
                 print(f"Error: {DB_NAME} not found. Run migration first.")
+        elif len(sys.argv) > 1 and sys.argv[1] == "export-shards":
+            if os.path.exists(DB_NAME):
+                size = int(sys.argv[2]) if len(sys.argv) > 2 else SHARD_SIZE
+                export_shards(DB_NAME, shard_size=size)
+            else:
+                print(f"Error: {DB_NAME} not found. Run migration first.")
         else:
             catalog_data = []
             if os.path.exists(CATALOG_JSON):
@@ -0,0 +1,86 @@
+"""Times the CLI scripts against their versions at a baseline git revision.
+
+The baseline defaults to the parent of the commit that added plant_db.py,
+i.e. the scripts as they were when each opened plants.db with its own
+inline sqlite3.connect. Pass a revision to compare against another one:
+
+    python scripts/bench_startup.py [runs] [baseline-rev]
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import plant_db
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPTS = ["scripts/diagnostics_intel.py", "scripts/list_windows.py"]
+
+
+def git(*args):
+    return subprocess.run(
+        ["git", *args], cwd=ROOT, capture_output=True, text=True, check=True
+    ).stdout
+
+
+def default_baseline_rev():
+    """Returns the revision just before plant_db.py was introduced."""
+    added = git("log", "--diff-filter=A", "--format=%H", "--", "scripts/plant_db.py")
+    return git("rev-parse", "--short", f"{added.split()[-1]}^").strip()
+
+
+# Measure the steady state of a normal install, where imported modules such
+# as plant_db are loaded from cached bytecode rather than recompiled per run.
+CHILD_ENV = {k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+
+
+def time_command(args):
+    start = time.perf_counter()
+    subprocess.run(args, cwd=ROOT, env=CHILD_ENV, stdout=subprocess.DEVNULL, check=True)
+    return (time.perf_counter() - start) * 1000
+
+
+def run_benchmark(runs=30, baseline_rev=None):
+    """Measures best-of-N end-to-end wall time in ms.
+
+    Returns ``(interpreter_ms, {script: (baseline_ms, current_ms)})``. Runs
+    alternate between the baseline and current script so machine noise hits
+    both alike.
+    """
+    baseline_rev = baseline_rev or default_baseline_rev()
+    interpreter = min(time_command([sys.executable, "-c", "pass"]) for _ in range(runs))
+    results = {}
+    with tempfile.TemporaryDirectory() as baseline_dir:
+        for script in SCRIPTS:
+            # Run the baseline as a file too, so both sides pay the same cost
+            # for reading and compiling __main__.
+            baseline_script = os.path.join(baseline_dir, os.path.basename(script))
+            with open(baseline_script, "w", encoding="utf-8") as f:
+                f.write(git("show", f"{baseline_rev}:{script}"))
+
+            baseline_args = [sys.executable, baseline_script]
+            current_args = [sys.executable, script]
+            baseline, current = float("inf"), float("inf")
+            for _ in range(runs):
+                baseline = min(baseline, time_command(baseline_args))
+                current = min(current, time_command(current_args))
+            results[script] = (baseline, current)
+    return interpreter, results
+
+
+if __name__ == "__main__":
+    if not os.path.exists(plant_db.DB_PATH):
+        print(f"Error: {plant_db.DB_PATH} not found.")
+        print("Run 'python public/data/ingest.py' to build it first.")
+        sys.exit(1)
+
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    baseline_rev = sys.argv[2] if len(sys.argv) > 2 else default_baseline_rev()
+    interpreter, results = run_benchmark(runs, baseline_rev)
+    print(f"python -c pass: {interpreter:.1f} ms (best of {runs})")
+    print(f"{'script':<32} {baseline_rev[:10]:>10} {'current':>10} {'change':>9}")
+    for name, (baseline, current) in results.items():
+        change = current - baseline
+        print(f"{name:<32} {baseline:7.1f} ms {current:7.1f} ms {change:+6.1f} ms")
@@ -1,57 +1,25 @@
-import sqlite3
 import json
 from datetime import datetime
 
-DB_PATH = "public/data/plants.db"
+import plant_db
 
 
 def analyze_diagnostics():
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
-
     current_month = datetime.now().month  # February (2)
     next_month = (current_month % 12) + 1
 
     # 1. Fetch Sowing Intel
-    cursor.execute(
-        """
-        SELECT p.common_name, s.start_month, s.end_month, p.notes
-        FROM plants p 
-        JOIN plant_seasonality s ON p.plant_id = s.plant_id 
-        WHERE s.activity = 'sowing' 
-        AND (
-            (s.start_month <= s.end_month AND ? BETWEEN s.start_month AND s.end_month) OR
-            (s.start_month > s.end_month AND (? >= s.start_month OR ? <= s.end_month))
-        )
-    """,
-        (current_month, current_month, current_month),
-    )
-    sowing_now_rows = cursor.fetchall()
-    sowing_now = [dict(row) for row in sowing_now_rows]
+    sowing_now = [
+        dict(row) for row in plant_db.active_windows("sowing", current_month)
+    ]
 
     # 2. Fetch Harvest Intel
-    cursor.execute(
-        """
-        SELECT p.common_name, s.start_month, s.end_month, p.notes
-        FROM plants p 
-        JOIN plant_seasonality s ON p.plant_id = s.plant_id 
-        WHERE s.activity = 'harvest' 
-        AND (
-            (s.start_month <= s.end_month AND ? BETWEEN s.start_month AND s.end_month) OR
-            (s.start_month > s.end_month AND (? >= s.start_month OR ? <= s.end_month))
-        )
-    """,
-        (current_month, current_month, current_month),
-    )
-    harvest_now_rows = cursor.fetchall()
-    harvest_now = [dict(row) for row in harvest_now_rows]
+    harvest_now = [
+        dict(row) for row in plant_db.active_windows("harvest", current_month)
+    ]
 
     # 3. Fetch Gaps
-    cursor.execute(
-        "SELECT common_name FROM plants WHERE plant_id NOT IN (SELECT plant_id FROM plant_seasonality)"
-    )
-    missing_seasonality = [row[0] for row in cursor.fetchall()]
+    missing_seasonality = plant_db.plants_missing_seasonality()
 
     # 4. Intel: Expiring Sowing Windows
     expiring_sowing = []
@@ -65,7 +33,7 @@ def analyze_diagnostics():
         if p["start_month"] != p["end_month"]:
             peak_harvest.append(p["common_name"])
 
-    total_count = cursor.execute("SELECT COUNT(*) FROM plants").fetchone()[0]
+    total_count = plant_db.plant_count()
 
     analysis = {
         "timestamp": datetime.now().isoformat(),
@@ -88,7 +56,6 @@ def analyze_diagnostics():
         },
     }
 
-    conn.close()
     return analysis
 
 
@@ -1,36 +1,8 @@
-import sqlite3
-import json
-
-DB_PATH = "public/data/plants.db"
-MONTHS = [
-    "",
-    "January",
-    "February",
-    "March",
-    "April",
-    "May",
-    "June",
-    "July",
-    "August",
-    "September",
-    "October",
-    "November",
-    "December",
-]
+import plant_db
 
 
 def get_full_catalog():
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
-
-    cursor.execute("""
-        SELECT p.common_name, s.activity, s.start_month, s.end_month 
-        FROM plants p 
-        JOIN plant_seasonality s ON p.plant_id = s.plant_id 
-        ORDER BY p.common_name, s.activity
-    """)
-    rows = cursor.fetchall()
+    rows = plant_db.seasonality_windows()
 
     catalog = {}
     for r in rows:
@@ -38,11 +10,10 @@ def get_full_catalog():
         if name not in catalog:
             catalog[name] = {}
 
-        start = MONTHS[r["start_month"]]
-        end = MONTHS[r["end_month"]]
+        start = plant_db.MONTH_NAMES[r["start_month"]]
+        end = plant_db.MONTH_NAMES[r["end_month"]]
         catalog[name][r["activity"]] = f"{start} to {end}"
 
-    conn.close()
     return catalog
 
 
@@ -0,0 +1,121 @@
+"""Shared read-only access to public/data/plants.db for the CLI scripts.
+
+Connections are opened with ``mode=ro`` and memory-mapped I/O, and cached
+per path for the life of the process. They still take SQLite's normal
+locks, so rebuilds by ingest.py and direct edits to the DB are seen as soon
+as they commit. sqlite3 is imported on first use so scripts that only need
+the month tables stay cheap to start.
+"""
+
+import os
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DB_PATH = os.path.join(ROOT, "public", "data", "plants.db")
+MMAP_SIZE = 64 * 1024 * 1024
+
+# Month names indexed by month number; index 0 is a placeholder
+MONTH_NAMES = [
+    "",
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+]
+
+# Mapping for month conversion to integers
+MONTHS = {name: number for number, name in enumerate(MONTH_NAMES) if name}
+
+_connections = {}
+
+
+def db_uri(db_path=DB_PATH):
+    """Builds a read-only SQLite URI for ``db_path``."""
+    path = os.path.abspath(db_path).replace("\\", "/")
+    for char, escaped in (("%", "%25"), ("?", "%3f"), ("#", "%23")):
+        path = path.replace(char, escaped)
+    if not path.startswith("/"):
+        path = "/" + path
+    return f"file:{path}?mode=ro"
+
+
+def get_connection(db_path=DB_PATH):
+    """Returns the cached read-only connection for ``db_path``.
+
+    The connection is opened on first use.
+    """
+    key = os.path.abspath(db_path)
+    if key not in _connections:
+        import sqlite3
+
+        conn = sqlite3.connect(db_uri(key), uri=True)
+        conn.row_factory = sqlite3.Row
+        conn.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+        _connections[key] = conn
+    return _connections[key]
+
+
+def close_connection(db_path=None):
+    """Closes the cached connection for ``db_path``, or all of them.
+
+    The next ``get_connection`` call opens a fresh connection to that path.
+    """
+    keys = list(_connections) if db_path is None else [os.path.abspath(db_path)]
+    for key in keys:
+        conn = _connections.pop(key, None)
+        if conn is not None:
+            conn.close()
+
+
+def active_windows(activity, month, db_path=DB_PATH):
+    """Returns plants whose ``activity`` window covers ``month``.
+
+    Windows that wrap past December, such as November to March, are matched.
+    """
+    return get_connection(db_path).execute(
+        """
+        SELECT p.common_name, s.start_month, s.end_month, p.notes
+        FROM plants p
+        JOIN plant_seasonality s ON p.plant_id = s.plant_id
+        WHERE s.activity = ?
+        AND (
+            (s.start_month <= s.end_month AND ? BETWEEN s.start_month AND s.end_month) OR
+            (s.start_month > s.end_month AND (? >= s.start_month OR ? <= s.end_month))
+        )
+    """,
+        (activity, month, month, month),
+    ).fetchall()
+
+
+def seasonality_windows(db_path=DB_PATH):
+    """Returns every seasonality window joined to its plant name."""
+    return get_connection(db_path).execute("""
+        SELECT p.common_name, s.activity, s.start_month, s.end_month
+        FROM plants p
+        JOIN plant_seasonality s ON p.plant_id = s.plant_id
+        ORDER BY p.common_name, s.activity
+    """).fetchall()
+
+
+def plants_missing_seasonality(db_path=DB_PATH):
+    """Returns common names of plants with no seasonality windows."""
+    return [
+        row[0]
+        for row in get_connection(db_path).execute("""
+            SELECT common_name FROM plants
+            WHERE plant_id NOT IN (SELECT plant_id FROM plant_seasonality)
+        """)
+    ]
+
+
+def plant_count(db_path=DB_PATH):
+    """Returns the number of plants in the catalog."""
+    conn = get_connection(db_path)
+    return conn.execute("SELECT COUNT(*) FROM plants").fetchone()[0]
@@ -0,0 +1,29 @@
+import json
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "public", "data"))
+sys.path.insert(0, os.path.join(ROOT, "scripts"))
+
+import ingest  # noqa: E402
+
+
+@pytest.fixture
+def merged():
+    """Merged catalog and KB entries from the checked-in JSON files."""
+    with open(ingest.CATALOG_JSON, "r", encoding="utf-8-sig") as f:
+        catalog_data = json.load(f)
+    with open(ingest.KB_JSON, "r", encoding="utf-8-sig") as f:
+        kb_data = json.load(f)
+    return ingest.merge_data(catalog_data, kb_data)
+
+
+@pytest.fixture
+def db_path(tmp_path, merged):
+    """Path to a freshly ingested plants.db in a temporary directory."""
+    path = str(tmp_path / "plants.db")
+    ingest.ingest_data(path, merged)
+    return path
@@ -0,0 +1,209 @@
+import json
+import os
+import sqlite3
+import threading
+
+import pytest
+
+import ingest
+
+
+@pytest.mark.parametrize("writers", [1, 3])
+def test_rebuild_never_exposes_partial_database(tmp_path, db_path, merged, writers):
+    conn = sqlite3.connect(db_path)
+    expected_plants = conn.execute("SELECT COUNT(*) FROM plants").fetchone()[0]
+    expected_windows = conn.execute(
+        "SELECT COUNT(*) FROM plant_seasonality"
+    ).fetchone()[0]
+    conn.close()
+
+    stop = threading.Event()
+    failures = []
+    reads = [0]
+
+    def reader():
+        while not stop.is_set():
+            try:
+                conn = sqlite3.connect(db_path, timeout=0.1)
+                plants = conn.execute("SELECT COUNT(*) FROM plants").fetchone()[0]
+                windows = conn.execute(
+                    """
+                    SELECT COUNT(*) FROM plants p
+                    JOIN plant_seasonality s ON p.plant_id = s.plant_id
+                    """
+                ).fetchone()[0]
+                conn.close()
+                if (plants, windows) != (expected_plants, expected_windows):
+                    failures.append((plants, windows))
+                reads[0] += 1
+            except sqlite3.Error as e:
+                failures.append(repr(e))
+
+    def writer():
+        try:
+            for _ in range(10 // writers):
+                ingest.ingest_data(db_path, merged)
+        except Exception as e:
+            failures.append(repr(e))
+
+    readers = [threading.Thread(target=reader) for _ in range(4)]
+    for t in readers:
+        t.start()
+    try:
+        rebuilds = [threading.Thread(target=writer) for _ in range(writers)]
+        for t in rebuilds:
+            t.start()
+        for t in rebuilds:
+            t.join()
+    finally:
+        stop.set()
+        for t in readers:
+            t.join()
+
+    assert not failures, failures[:5]
+    assert reads[0] > 0
+    assert os.listdir(tmp_path) == ["plants.db"]
+
+
+def test_rebuild_does_not_wait_for_open_readers(db_path, merged):
+    reader = sqlite3.connect(db_path, isolation_level=None)
+    reader.execute("BEGIN")
+    before = reader.execute("SELECT COUNT(*) FROM plants").fetchone()[0]
+
+    changed = dict(merged)
+    changed.pop(next(iter(changed)))
+    ingest.ingest_data(db_path, changed)
+
+    # The open read transaction keeps its snapshot; a new one sees the rebuild
+    assert reader.execute("SELECT COUNT(*) FROM plants").fetchone()[0] == before
+    reader.execute("COMMIT")
+    assert reader.execute("SELECT COUNT(*) FROM plants").fetchone()[0] == before - 1
+    reader.close()
+
+    conn = sqlite3.connect(db_path)
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master")}
+    assert not {t for t in tables if t.endswith(ingest.SHADOW_SUFFIX)}
+    assert {"idx_plant_type", "idx_interactions_type"} <= tables
+    conn.close()
+
+
+def test_failed_rebuild_keeps_live_database(tmp_path, db_path, merged):
+    broken = dict(merged)
+    first_id = next(iter(broken))
+    broken[first_id] = {**broken[first_id], "growth_stages": None}
+    with pytest.raises(TypeError):
+        ingest.ingest_data(db_path, broken)
+
+    assert os.listdir(tmp_path) == ["plants.db"]
+    conn = sqlite3.connect(db_path)
+    assert conn.execute("SELECT COUNT(*) FROM plants").fetchone()[0] == len(broken)
+    conn.close()
+
+
+def load_shards(shards_dir):
+    with open(os.path.join(shards_dir, "index.json"), encoding="utf-8") as f:
+        index = json.load(f)
+    shards = []
+    for shard in index["shards"]:
+        with open(os.path.join(shards_dir, shard["file"]), encoding="utf-8") as f:
+            shards.append(json.load(f))
+    return index, shards
+
+
+def test_shards_round_trip_to_full_export(tmp_path, db_path):
+    shards_dir = str(tmp_path / "shards")
+
+    catalog_output, kb_output = ingest.build_export(db_path)
+    ingest.export_shards(db_path, shards_dir=shards_dir, shard_size=10)
+    index, shards = load_shards(shards_dir)
+
+    catalog_union, kb_union = [], []
+    for shard_no, (shard, data) in enumerate(zip(index["shards"], shards)):
+        assert 0 < len(data["catalog"]) <= 10
+        assert shard["count"] == len(data["catalog"]) == len(data["kb"])
+        ids = [entry["id"] for entry in data["catalog"]]
+        assert ids == sorted(ids)
+        assert (ids[0], ids[-1]) == (shard["first_id"], shard["last_id"])
+        assert [entry["plant_id"] for entry in data["kb"]] == ids
+        for entry in data["catalog"]:
+            assert entry["plant_type"] == shard["plant_type"]
+            assert index["plants"][entry["id"]]["shard"] == shard_no
+            assert index["plants"][entry["id"]]["name"] == entry["name"]
+        catalog_union.extend(data["catalog"])
+        kb_union.extend(data["kb"])
+
+    assert len(catalog_union) == len(catalog_output) == index["total"]
+    assert {e["id"]: e for e in catalog_union} == {e["id"]: e for e in catalog_output}
+    assert {e["plant_id"]: e for e in kb_union} == {
+        e["plant_id"]: e for e in kb_output
+    }
+
+    for month, shard_nos in index["months"].items():
+        for plant in index["plants"].values():
+            if int(month) in plant["sowing_months"] + plant["harvest_months"]:
+                assert plant["shard"] in shard_nos
+
+
+def test_type_lookup_touches_only_its_shards(tmp_path, db_path):
+    shards_dir = str(tmp_path / "shards")
+    ingest.export_shards(db_path, shards_dir=shards_dir, shard_size=10)
+    index, shards = load_shards(shards_dir)
+
+    herbs = index["types"]["herb"]
+    assert 0 < len(herbs) < len(index["shards"])
+    loaded = [entry for shard_no in herbs for entry in shards[shard_no]["catalog"]]
+    expected = [p for p in index["plants"].values() if p["plant_type"] == "herb"]
+    assert len(loaded) == len(expected)
+    assert all(entry["plant_type"] == "herb" for entry in loaded)
+
+
+def test_reexport_replaces_index_before_removing_old_shards(
+    tmp_path, db_path, merged, monkeypatch
+):
+    shards_dir = str(tmp_path / "shards")
+    ingest.export_shards(db_path, shards_dir=shards_dir, shard_size=10)
+    old_index, _ = load_shards(shards_dir)
+
+    changed = dict(merged)
+    first_id = next(iter(changed))
+    changed[first_id] = {**changed[first_id], "notes": "Updated notes"}
+    ingest.ingest_data(db_path, changed)
+
+    # Every file the live index names must exist whenever a shard is removed
+    real_remove = os.remove
+    checked = []
+
+    def remove(path):
+        if os.path.dirname(path) == shards_dir:
+            index, _ = load_shards(shards_dir)
+            assert os.path.basename(path) not in {s["file"] for s in index["shards"]}
+            checked.append(path)
+        real_remove(path)
+
+    monkeypatch.setattr(os, "remove", remove)
+    ingest.export_shards(db_path, shards_dir=shards_dir, shard_size=10)
+    monkeypatch.undo()
+    new_index, _ = load_shards(shards_dir)
+
+    assert checked
+
+    assert new_index["generation"] != old_index["generation"]
+    assert sorted(os.listdir(shards_dir)) == sorted(
+        ["index.json"] + [shard["file"] for shard in new_index["shards"]]
+    )
+
+
+@pytest.mark.parametrize("shard_size", [0, -5])
+def test_export_shards_rejects_non_positive_size(tmp_path, shard_size):
+    shards_dir = str(tmp_path / "shards")
+    with pytest.raises(ValueError, match="shard_size"):
+        ingest.export_shards(
+            str(tmp_path / "plants.db"), shards_dir=shards_dir, shard_size=shard_size
+        )
+    assert not os.path.exists(shards_dir)
+
+
+def test_season_months_wraps_year_end():
+    windows = [{"start_month": 11, "end_month": 2}, {"start_month": 6, "end_month": 6}]
+    assert ingest.season_months(windows) == [1, 2, 6, 11, 12]
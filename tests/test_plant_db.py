@@ -0,0 +1,76 @@
+import sqlite3
+
+import pytest
+
+import ingest
+import plant_db
+
+
+@pytest.fixture(autouse=True)
+def close_connections():
+    yield
+    plant_db.close_connection()
+
+
+def test_connection_is_cached_and_read_only(db_path, merged):
+    conn = plant_db.get_connection(db_path)
+    assert plant_db.get_connection(db_path) is conn
+    with pytest.raises(sqlite3.OperationalError):
+        conn.execute("DELETE FROM plants")
+    assert plant_db.plant_count(db_path) == len(merged)
+
+
+def test_direct_edits_are_visible_after_publish(db_path, merged):
+    assert plant_db.plant_count(db_path) == len(merged)
+
+    editor = sqlite3.connect(db_path)
+    editor.execute("PRAGMA journal_mode=WAL")
+    editor.execute(
+        "INSERT INTO plants (plant_id, common_name) VALUES ('plant_test', 'Test')"
+    )
+    editor.commit()
+
+    assert plant_db.plant_count(db_path) == len(merged) + 1
+    names = {row["common_name"] for row in plant_db.seasonality_windows(db_path)}
+    assert plant_db.plants_missing_seasonality(db_path).count("Test") == 1
+    assert "Test" not in names
+    editor.close()
+
+
+def test_connections_are_cached_per_path(db_path, tmp_path):
+    other_path = str(tmp_path / "other.db")
+    sqlite3.connect(other_path).close()
+
+    conn = plant_db.get_connection(db_path)
+    other = plant_db.get_connection(other_path)
+    assert other is not conn
+    assert plant_db.get_connection(db_path) is conn
+
+    plant_db.close_connection(other_path)
+    assert plant_db.get_connection(db_path) is conn
+    assert plant_db.get_connection(other_path) is not other
+
+
+def test_active_windows_wraps_year_end(db_path):
+    for month in plant_db.MONTHS.values():
+        names = {
+            row["common_name"]
+            for row in plant_db.active_windows("sowing", month, db_path)
+        }
+        expected = {
+            row["common_name"]
+            for row in plant_db.seasonality_windows(db_path)
+            if row["activity"] == "sowing"
+            and month in ingest.season_months([dict(row)])
+        }
+        assert names == expected
+
+
+def test_ingest_month_tables_match_plant_db():
+    assert ingest.MONTH_NAMES == plant_db.MONTH_NAMES
+    assert ingest.MONTHS == plant_db.MONTHS
+
+
+def test_db_uri_escapes_reserved_characters():
+    uri = plant_db.db_uri("/tmp/odd?name#1%.db")
+    assert uri == "file:/tmp/odd%3fname%231%25.db?mode=ro"